@@ -6,13 +6,27 @@ import logging
 from pathlib import Path
 from typing import Optional, Any, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import yaml
 import toml
 from pydantic import BaseModel, Field
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Files whose presence in a project root identifies its languages
+LANGUAGE_MARKERS: dict[str, tuple[str, ...]] = {
+    "python": ("pyproject.toml", "requirements.txt"),
+    "typescript": ("package.json", "tsconfig.json"),
+    "go": ("go.mod",),
+    "rust": ("Cargo.toml",),
+}
+
 
 @dataclass
 class StandardMetadata:
@@ -56,6 +70,15 @@ class StandardsConfig(BaseModel):
     )
 
 
+@lru_cache(maxsize=8)
+def _load_config_file(config_file: Path, mtime_ns: int) -> StandardsConfig:
+    """Parse a standards config.toml, memoized per path and modification time.
+
+    The cache is bounded so entries for superseded mtimes are evicted on edits.
+    """
+    return StandardsConfig(**toml.load(config_file))
+
+
 class StandardsManager:
     """Main class for managing coding standards."""
 
@@ -78,9 +101,14 @@ class StandardsManager:
     def _load_config(self) -> StandardsConfig:
         """Load the main standards configuration."""
         config_file = self.standards_path / "config.toml"
-        if config_file.exists():
-            config_data = toml.load(config_file)
-            return StandardsConfig(**config_data)
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        if mtime_ns is not None:
+            # Hand out a copy so callers can't mutate the cached config
+            return _load_config_file(config_file, mtime_ns).model_copy(deep=True)
         else:
             # Return default config
             return StandardsConfig(
@@ -131,8 +159,8 @@ class StandardsManager:
         # Load rules
         rules_file = lang_dir / "rules.yaml"
         if rules_file.exists():
-            with open(rules_file) as f:
-                standard["rules"] = yaml.safe_load(f)
+            with open(rules_file, "rb") as f:
+                standard["rules"] = yaml.load(f, Loader=_YamlLoader)
 
         # Load templates
         templates_dir = lang_dir / "templates"
@@ -194,26 +222,18 @@ class StandardsManager:
 
     def _detect_languages(self, project_path: Path) -> list[str]:
         """Detect languages used in a project."""
-        languages = []
-
-        # Check for language-specific files
-        if (project_path / "pyproject.toml").exists() or (
-            project_path / "requirements.txt"
-        ).exists():
-            languages.append("python")
-
-        if (project_path / "package.json").exists() or (
-            project_path / "tsconfig.json"
-        ).exists():
-            languages.append("typescript")
-
-        if (project_path / "go.mod").exists():
-            languages.append("go")
-
-        if (project_path / "Cargo.toml").exists():
-            languages.append("rust")
-
-        return languages
+        # List the directory once instead of stat-ing every marker file
+        try:
+            with os.scandir(project_path) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            return []
+
+        return [
+            language
+            for language, markers in LANGUAGE_MARKERS.items()
+            if not names.isdisjoint(markers)
+        ]
 
     def _validate_language(
         self, project_path: Path, language: str, standard: dict[str, Any]
@@ -1,20 +1,279 @@
 """Project generation and scaffolding functionality."""
 
+import copy
 import os
 import shutil
 import logging
+import subprocess
 from pathlib import Path
-from typing import Optional, Any, Union
+from types import MappingProxyType
+from typing import Callable, Optional, Any, Mapping, Union
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 
 import yaml
 import toml
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger(__name__)
 
+# Template counts above this are loaded on a thread pool by list_templates
+_PARALLEL_LOAD_THRESHOLD = 4
+
+# Parsed template.yaml contents by path, with the (mtime_ns, size) they were read at
+_TEMPLATE_CONFIG_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
+# Substrings that mark template content as Jinja rather than static text
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
+# Config keys passed to templates explicitly rather than as plain variables
+_STRIP_KEYS = frozenset({"language", "contributing", "code_quality"})
+
+# Templates bundled with this package, computed once at import
+_DEFAULT_TEMPLATES_PATH = Path(__file__).parent / "templates"
+
+# Per-language template variables that are always the same
+_LANGUAGE_FIXED_VARS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "python": MappingProxyType({"test_framework": "pytest"}),
+        "typescript": MappingProxyType(
+            {"type_checker": "typescript", "test_framework": "jest"}
+        ),
+        "go": MappingProxyType({"formatter": "gofmt", "test_framework": "testing"}),
+    }
+)
+
+# Per-language template variable defaults, overridable via config["code_quality"]
+_LANGUAGE_CONFIGURABLE_VARS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "python": MappingProxyType(
+            {
+                "formatter": "black",
+                "linter": "flake8",
+                "type_checker": "mypy",
+                "line_length": 88,
+                "python_version": "3.11",
+                "poetry_enabled": False,
+            }
+        ),
+        "typescript": MappingProxyType(
+            {
+                "formatter": "prettier",
+                "linter": "eslint",
+                "line_length": 80,
+                "node_version": "20",
+                "es_target": "ES2024",
+            }
+        ),
+        "go": MappingProxyType({"linter": "golangci-lint", "go_version": "1.21"}),
+    }
+)
+
+# Shared environment for inline template strings; default settings match
+# what a bare jinja2.Template(...) renders with
+_ENV = Environment(autoescape=False)
+
+
+# .gitignore contents written for detected project types
+
+_GITIGNORE_PYTHON = """# Python
+__pycache__/
+*.py[cod]
+*$py.class
+*.so
+.Python
+build/
+develop-eggs/
+dist/
+downloads/
+eggs/
+.eggs/
+lib/
+lib64/
+parts/
+sdist/
+var/
+wheels/
+*.egg-info/
+.installed.cfg
+*.egg
+MANIFEST
+
+# Virtual environments
+.env
+.venv
+env/
+venv/
+ENV/
+env.bak/
+venv.bak/
 
-@dataclass
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+*~
+
+# Testing
+.coverage
+.pytest_cache/
+htmlcov/
+.tox/
+.nox/
+.coverage.*
+.cache
+nosetests.xml
+coverage.xml
+*.cover
+.hypothesis/
+
+# mypy
+.mypy_cache/
+.dmypy.json
+dmypy.json
+"""
+
+_GITIGNORE_NODE = """# Dependencies
+node_modules/
+npm-debug.log*
+yarn-debug.log*
+yarn-error.log*
+
+# Production builds
+build/
+dist/
+.next/
+out/
+
+# Environment variables
+.env
+.env.local
+.env.development.local
+.env.test.local
+.env.production.local
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Logs
+logs
+*.log
+
+# Runtime data
+pids
+*.pid
+*.seed
+*.pid.lock
+
+# Coverage directory used by tools like istanbul
+coverage/
+.nyc_output
+
+# TypeScript
+*.tsbuildinfo
+"""
+
+_GITIGNORE_GENERAL = """# General
+.DS_Store
+Thumbs.db
+*.log
+*.tmp
+*.temp
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+*~
+
+# Build artifacts
+build/
+dist/
+target/
+"""
+
+
+@lru_cache(maxsize=None)
+def _compile(source: str) -> Template:
+    """Compile a template string once and reuse it for identical sources."""
+    return _ENV.from_string(source)
+
+
+@lru_cache(maxsize=None)
+def _file_environment(templates_path: str) -> Environment:
+    """Environment for template files below templates_path, shared by generators.
+
+    Template files render with the same default settings as inline strings.
+    Compiled bytecode is cached on disk across runs, and the loader
+    recompiles a template whenever its file changes.
+    """
+    try:
+        bytecode_cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        bytecode_cache = None
+
+    return Environment(
+        loader=FileSystemLoader(templates_path),
+        bytecode_cache=bytecode_cache,
+        autoescape=False,
+    )
+
+
+def _load_template_config(config_file: Path) -> Any:
+    """Parse a template.yaml, reusing the last parse while the file is unchanged.
+
+    The returned data is shared between callers and must not be mutated.
+    """
+    stat = os.stat(config_file)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = os.fspath(config_file)
+
+    cached = _TEMPLATE_CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # libyaml reads bytes directly, so skip the text decoding layer
+    with open(config_file, "rb") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    _TEMPLATE_CONFIG_CACHE[key] = (stamp, config)
+    return config
+
+
+def _render_static(content: str) -> str:
+    """Return what Jinja renders for content that contains no template syntax."""
+    # Jinja normalizes line endings and drops a single trailing newline
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content[:-1] if content.endswith("\n") else content
+
+
+def _write_file(path: Union[str, Path], data: bytes) -> None:
+    """Write data to path with raw os calls, bypassing the text I/O layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+@dataclass(slots=True, frozen=True)
 class ProjectTemplate:
     """A project template configuration."""
 
@@ -27,6 +286,16 @@ class ProjectTemplate:
     features: dict[str, Any]  # feature flags and configuration
 
 
+@dataclass
+class _TemplateIndex:
+    """Template directory lookups, valid while the watched dirs are unchanged."""
+
+    dirs: list[str]  # templates root followed by each language directory
+    version: tuple[int, ...]  # st_mtime_ns of each entry in dirs
+    by_name: dict[str, Path]  # template name -> first matching template dir
+    by_language: dict[str, Optional[Path]]  # language -> default template dir
+
+
 class ProjectGenerator:
     """Generates new projects with coding standards."""
 
@@ -38,17 +307,13 @@ class ProjectGenerator:
         """
         if templates_path is None:
             # Use the templates directory in this package
-            package_dir = Path(__file__).parent
-            self.templates_path = package_dir / "templates"
+            self.templates_path = _DEFAULT_TEMPLATES_PATH
         else:
             self.templates_path = Path(templates_path)
 
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_path)),
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.jinja_env = _file_environment(str(self.templates_path))
+
+        self._template_index: Optional[_TemplateIndex] = None
 
     def _prepare_template_vars(
         self, language: str, config: dict[str, Any], **additional_vars
@@ -65,15 +330,11 @@ class ProjectGenerator:
         """
         template_vars = self._get_template_vars(language, config)
 
-        # Remove commonly duplicated keys to prevent conflicts
-        keys_to_remove = ["language", "contributing", "code_quality"]
-        for key in keys_to_remove:
-            template_vars.pop(key, None)
-
-        # Add additional variables
-        template_vars.update(additional_vars)
-
-        return template_vars
+        # Drop commonly duplicated keys to prevent conflicts, then add
+        # the additional variables
+        return {
+            key: value for key, value in template_vars.items() if key not in _STRIP_KEYS
+        } | additional_vars
 
     def _render_template(self, template_content: str, **template_vars) -> str:
         """Render a Jinja2 template with the given variables.
@@ -86,12 +347,46 @@ class ProjectGenerator:
             Rendered template content
         """
         try:
-            jinja_template = Template(template_content)
-            return jinja_template.render(**template_vars)
+            return _compile(template_content).render(**template_vars)
         except Exception as e:
             logger.warning(f"Failed to render template: {e}")
             return template_content
 
+    def _render_template_to(
+        self, target_path: str, template_content: str, **template_vars
+    ) -> None:
+        """Render a Jinja2 template straight into a file.
+
+        Args:
+            target_path: File to write the rendered content to
+            template_content: Raw template content
+            **template_vars: Variables to render the template with
+        """
+        try:
+            _compile(template_content).stream(**template_vars).dump(
+                target_path, encoding="utf-8"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to render template: {e}")
+            _write_file(target_path, template_content.encode("utf-8"))
+
+    def _render_template_file(self, template_file: Path, **template_vars) -> str:
+        """Render a template file below the templates directory.
+
+        Args:
+            template_file: Path to the template file
+            **template_vars: Variables to render the template with
+
+        Returns:
+            Rendered template content
+        """
+        try:
+            name = template_file.relative_to(self.templates_path).as_posix()
+            return self.jinja_env.get_template(name).render(**template_vars)
+        except Exception as e:
+            logger.warning(f"Failed to render template: {e}")
+            return template_file.read_text()
+
     def create_project(
         self,
         path: Union[str, Path],
@@ -142,7 +437,7 @@ class ProjectGenerator:
                 self._init_git_repo(path, config)
 
             # Install pre-commit hooks
-            if config and config.get("code_quality", {}).get(
+            if config and (config.get("code_quality") or {}).get(
                 "pre_commit_enabled", True
             ):
                 self._install_pre_commit_hooks(path, language)
@@ -156,54 +451,121 @@ class ProjectGenerator:
                 shutil.rmtree(path)
             return False
 
-    def _get_default_template(self, language: str) -> Optional[ProjectTemplate]:
-        """Get the default template for a language."""
-        template_dir = self.templates_path / language
-        if not template_dir.exists():
-            return None
+    def _get_template_index(self, rescan: bool = False) -> _TemplateIndex:
+        """Return the template lookups, rescanning only after a directory changes.
 
-        # Look for default template
-        default_template = template_dir / "default"
-        if default_template.exists():
-            return self._load_template(default_template)
+        Adding or removing a language or template updates the mtime of the
+        templates root or the language directory, so stat-ing those is enough
+        to tell whether the cached index is still valid. Pass rescan=True to
+        rebuild it regardless.
+        """
+        index = self._template_index
+        if index is not None and not rescan:
+            try:
+                version = tuple(os.stat(d).st_mtime_ns for d in index.dirs)
+            except OSError:
+                version = None
+            if version == index.version:
+                return index
+
+        root = os.fspath(self.templates_path)
+        dirs = [root]
+        version = []
+        by_name: dict[str, Path] = {}
+        by_language: dict[str, Optional[Path]] = {}
+        try:
+            version.append(os.stat(root).st_mtime_ns)
+            with os.scandir(root) as entries:
+                lang_dirs = [entry for entry in entries if entry.is_dir()]
+        except OSError:
+            # Nothing to index; don't cache so a later call can retry
+            return _TemplateIndex(dirs, tuple(version), by_name, by_language)
+
+        for lang_dir in lang_dirs:
+            dirs.append(lang_dir.path)
+            version.append(os.stat(lang_dir.path).st_mtime_ns)
+            with os.scandir(lang_dir.path) as entries:
+                template_entries = list(entries)
+
+            default_dir = None
+            for entry in template_entries:
+                by_name.setdefault(entry.name, Path(entry.path))
+                if entry.name == "default":
+                    default_dir = Path(entry.path)
+            if default_dir is None:
+                # Fall back to first available template
+                default_dir = next(
+                    (Path(entry.path) for entry in template_entries if entry.is_dir()),
+                    None,
+                )
+            by_language[lang_dir.name] = default_dir
+
+        self._template_index = _TemplateIndex(
+            dirs, tuple(version), by_name, by_language
+        )
+        return self._template_index
+
+    def _find_template(
+        self, lookup: Callable[[_TemplateIndex], Optional[Path]]
+    ) -> Optional[ProjectTemplate]:
+        """Load the template picked by lookup, rescanning the index once if stale.
+
+        A change made within the same timestamp tick as the last scan leaves
+        directory mtimes unchanged, so a miss or a vanished template directory
+        triggers one full rescan before giving up.
+        """
+        template_dir = lookup(self._get_template_index())
+        if template_dir is not None:
+            try:
+                return self._load_template(template_dir)
+            except ValueError:
+                pass
+
+        template_dir = lookup(self._get_template_index(rescan=True))
+        if template_dir is None:
+            return None
 
-        # Fall back to first available template
-        for template_subdir in template_dir.iterdir():
-            if template_subdir.is_dir():
-                return self._load_template(template_subdir)
+        return self._load_template(template_dir)
 
-        return None
+    def _get_default_template(self, language: str) -> Optional[ProjectTemplate]:
+        """Get the default template for a language."""
+        return self._find_template(lambda index: index.by_language.get(language))
 
     def _get_template(self, template_name: str) -> Optional[ProjectTemplate]:
         """Get a specific template by name."""
         # Search in all language directories
-        for lang_dir in self.templates_path.iterdir():
-            if lang_dir.is_dir():
-                template_dir = lang_dir / template_name
-                if template_dir.exists():
-                    return self._load_template(template_dir)
-
-        return None
+        return self._find_template(lambda index: index.by_name.get(template_name))
 
     def _load_template(self, template_dir: Path) -> ProjectTemplate:
         """Load a template from directory."""
         # Load template configuration
         config_file = template_dir / "template.yaml"
-        if not config_file.exists():
+        try:
+            # The parsed config is cached and shared; give each template its own copy
+            config = copy.deepcopy(_load_template_config(config_file))
+        except FileNotFoundError:
             raise ValueError(f"Template configuration not found: {config_file}")
 
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
-
         # Load file templates
+        # os.walk is scandir based, so no per-entry stat is needed to tell
+        # files from directories; it yields nothing when files/ is missing.
+        # Like rglob, it does not descend into symlinked directories.
         files = {}
-        files_dir = template_dir / "files"
-        if files_dir.exists():
-            for file_path in files_dir.rglob("*"):
-                if file_path.is_file():
-                    rel_path = file_path.relative_to(files_dir)
-                    with open(file_path) as f:
-                        files[str(rel_path)] = f.read()
+        files_dir = os.path.join(template_dir, "files")
+        for root, _, file_names in os.walk(files_dir):
+            rel_root = os.path.relpath(root, files_dir)
+            for file_name in file_names:
+                file_path = os.path.join(root, file_name)
+                try:
+                    f = open(file_path)
+                except OSError:
+                    # Dangling or looping symlinks are not files; skip them
+                    if os.path.islink(file_path):
+                        continue
+                    raise
+                with f:
+                    rel_path = os.path.normpath(os.path.join(rel_root, file_name))
+                    files[rel_path] = f.read()
 
         return ProjectTemplate(
             name=config.get("name", template_dir.name),
@@ -218,18 +580,35 @@ class ProjectGenerator:
     def _generate_structure(self, path: Path, template: ProjectTemplate):
         """Generate the project directory structure."""
         structure = template.structure
+        base = os.fspath(path)
+        empty_files = [
+            os.path.normpath(os.path.join(base, file_name))
+            for file_name in structure.get("empty_files", [])
+        ]
+
+        # Collect every directory needed, including parents of empty files,
+        # and only create the leaves; makedirs creates their ancestors
+        dir_paths = {
+            os.path.normpath(os.path.join(base, dir_name))
+            for dir_name in structure.get("directories", [])
+        }
+        dir_paths.update(os.path.dirname(file_path) for file_path in empty_files)
+
+        ancestors = set()
+        for dir_path in dir_paths:
+            parent = os.path.dirname(dir_path)
+            while parent not in ancestors and parent != dir_path:
+                ancestors.add(parent)
+                dir_path, parent = parent, os.path.dirname(parent)
 
         # Create directories
-        for dir_name in structure.get("directories", []):
-            dir_path = path / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+        for dir_path in sorted(dir_paths - ancestors):
+            os.makedirs(dir_path, exist_ok=True)
             logger.debug(f"Created directory: {dir_path}")
 
-        # Create empty files
-        for file_name in structure.get("empty_files", []):
-            file_path = path / file_name
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.touch()
+        # Create empty files without truncating or needing write access to existing ones
+        for file_path in empty_files:
+            os.close(os.open(file_path, os.O_RDONLY | os.O_CREAT, 0o666))
             logger.debug(f"Created empty file: {file_path}")
 
     def _generate_files(
@@ -240,22 +619,25 @@ class ProjectGenerator:
         config: Optional[dict[str, Any]] = None,
     ):
         """Generate project files from templates."""
-        for file_path, content in template.files.items():
-            try:
-                # Prepare template variables
-                template_vars = self._prepare_template_vars(
-                    language, config or {}, project_name=path.name
-                )
+        base = os.fspath(path)
 
-                # Render template content
-                rendered_content = self._render_template(content, **template_vars)
+        # Template variables are the same for every file, so prepare them once
+        template_vars = self._prepare_template_vars(
+            language, config or {}, project_name=path.name
+        )
 
+        for file_path, content in template.files.items():
+            try:
                 # Create target file
-                target_path = path / file_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                target_path = os.path.join(base, file_path)
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
 
-                with open(target_path, "w") as f:
-                    f.write(rendered_content)
+                # Stream rendered content to disk; files without Jinja syntax
+                # skip Jinja
+                if any(marker in content for marker in _JINJA_MARKERS):
+                    self._render_template_to(target_path, content, **template_vars)
+                else:
+                    _write_file(target_path, _render_static(content).encode("utf-8"))
 
                 logger.debug(f"Generated file: {target_path}")
 
@@ -307,9 +689,6 @@ class ProjectGenerator:
         """Generate CONTRIBUTING.md file."""
         contributing_template = self.templates_path / "common" / "CONTRIBUTING.md.j2"
         if contributing_template.exists():
-            with open(contributing_template) as f:
-                template_content = f.read()
-
             # Prepare template variables
             template_vars = self._prepare_template_vars(
                 language,
@@ -320,12 +699,13 @@ class ProjectGenerator:
             )
 
             # Render template
-            rendered_content = self._render_template(template_content, **template_vars)
+            rendered_content = self._render_template_file(
+                contributing_template, **template_vars
+            )
 
             # Write file
             contributing_path = path / "CONTRIBUTING.md"
-            with open(contributing_path, "w") as f:
-                f.write(rendered_content)
+            _write_file(contributing_path, rendered_content.encode("utf-8"))
 
             logger.debug(f"Generated CONTRIBUTING.md")
 
@@ -333,21 +713,17 @@ class ProjectGenerator:
         """Generate CODE_OF_CONDUCT.md file."""
         coc_template = self.templates_path / "common" / "CODE_OF_CONDUCT.md.j2"
         if coc_template.exists():
-            with open(coc_template) as f:
-                template_content = f.read()
-
             # Prepare template variables
             template_vars = self._prepare_template_vars(
                 config.get("language", "unknown"), config, project_name=path.name
             )
 
             # Render template
-            rendered_content = self._render_template(template_content, **template_vars)
+            rendered_content = self._render_template_file(coc_template, **template_vars)
 
             # Write file
             coc_path = path / "CODE_OF_CONDUCT.md"
-            with open(coc_path, "w") as f:
-                f.write(rendered_content)
+            _write_file(coc_path, rendered_content.encode("utf-8"))
 
             logger.debug(f"Generated CODE_OF_CONDUCT.md")
 
@@ -365,21 +741,17 @@ class ProjectGenerator:
             / "bug_report.md.j2"
         )
         if bug_template.exists():
-            with open(bug_template) as f:
-                template_content = f.read()
-
             # Prepare template variables
             template_vars = self._prepare_template_vars(
                 config.get("language", "unknown"), config, project_name=path.name
             )
 
             # Render template
-            rendered_content = self._render_template(template_content, **template_vars)
+            rendered_content = self._render_template_file(bug_template, **template_vars)
 
             # Write file
             bug_path = templates_dir / "bug_report.md"
-            with open(bug_path, "w") as f:
-                f.write(rendered_content)
+            _write_file(bug_path, rendered_content.encode("utf-8"))
 
         # Feature request template
         feature_template = (
@@ -390,21 +762,19 @@ class ProjectGenerator:
             / "feature_request.md.j2"
         )
         if feature_template.exists():
-            with open(feature_template) as f:
-                template_content = f.read()
-
             # Prepare template variables
             template_vars = self._prepare_template_vars(
                 config.get("language", "unknown"), config, project_name=path.name
             )
 
             # Render template
-            rendered_content = self._render_template(template_content, **template_vars)
+            rendered_content = self._render_template_file(
+                feature_template, **template_vars
+            )
 
             # Write file
             feature_path = templates_dir / "feature_request.md"
-            with open(feature_path, "w") as f:
-                f.write(rendered_content)
+            _write_file(feature_path, rendered_content.encode("utf-8"))
 
         logger.debug(f"Generated issue templates")
 
@@ -414,22 +784,18 @@ class ProjectGenerator:
             self.templates_path / "common" / ".github" / "PULL_REQUEST_TEMPLATE.md.j2"
         )
         if pr_template.exists():
-            with open(pr_template) as f:
-                template_content = f.read()
-
             # Prepare template variables
             template_vars = self._prepare_template_vars(
                 config.get("language", "unknown"), config, project_name=path.name
             )
 
             # Render template
-            rendered_content = self._render_template(template_content, **template_vars)
+            rendered_content = self._render_template_file(pr_template, **template_vars)
 
             # Write file
             pr_path = path / ".github" / "PULL_REQUEST_TEMPLATE.md"
             pr_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(pr_path, "w") as f:
-                f.write(rendered_content)
+            _write_file(pr_path, rendered_content.encode("utf-8"))
 
             logger.debug(f"Generated pull request template")
 
@@ -437,21 +803,19 @@ class ProjectGenerator:
         """Generate conventional commit template."""
         commit_template = self.templates_path / "common" / ".gitmessage.j2"
         if commit_template.exists():
-            with open(commit_template) as f:
-                template_content = f.read()
-
             # Prepare template variables
             template_vars = self._prepare_template_vars(
                 config.get("language", "unknown"), config
             )
 
             # Render template
-            rendered_content = self._render_template(template_content, **template_vars)
+            rendered_content = self._render_template_file(
+                commit_template, **template_vars
+            )
 
             # Write file
             gitmessage_path = path / ".gitmessage"
-            with open(gitmessage_path, "w") as f:
-                f.write(rendered_content)
+            _write_file(gitmessage_path, rendered_content.encode("utf-8"))
 
             logger.debug(f"Generated commit template")
 
@@ -476,8 +840,7 @@ class ProjectGenerator:
         # Basic CI workflow
         workflow_content = self._get_github_actions_workflow(language, ci_cd_config)
         workflow_path = workflows_dir / "ci.yml"
-        with open(workflow_path, "w") as f:
-            f.write(workflow_content)
+        _write_file(workflow_path, workflow_content.encode("utf-8"))
 
         logger.debug(f"Generated GitHub Actions workflow")
 
@@ -628,8 +991,7 @@ jobs:
         if docs_config.get("changelog_enabled", False):
             changelog_path = path / "CHANGELOG.md"
             changelog_content = self._get_changelog_content()
-            with open(changelog_path, "w") as f:
-                f.write(changelog_content)
+            _write_file(changelog_path, changelog_content.encode("utf-8"))
 
         # Generate documentation configuration files
         if docs_config.get("generator") == "mkdocs":
@@ -696,57 +1058,21 @@ plugins:
         python:
           paths: [src]
 """
-        with open(mkdocs_path, "w") as f:
-            f.write(mkdocs_content)
+        _write_file(mkdocs_path, mkdocs_content.encode("utf-8"))
 
     def _get_template_vars(
         self, language: str, config: dict[str, Any]
     ) -> dict[str, Any]:
         """Get template variables for a language."""
-        vars = {
-            "python": {
-                "formatter": config.get("code_quality", {}).get("formatter", "black"),
-                "linter": config.get("code_quality", {}).get("linter", "flake8"),
-                "type_checker": config.get("code_quality", {}).get(
-                    "type_checker", "mypy"
-                ),
-                "test_framework": "pytest",
-                "line_length": config.get("code_quality", {}).get("line_length", 88),
-                "python_version": config.get("code_quality", {}).get(
-                    "python_version", "3.11"
-                ),
-                "poetry_enabled": config.get("code_quality", {}).get(
-                    "poetry_enabled", False
-                ),
-                "author_name": config.get("author", "Your Name"),
-                "author_email": config.get("email", "your.email@example.com"),
-            },
-            "typescript": {
-                "formatter": config.get("code_quality", {}).get(
-                    "formatter", "prettier"
-                ),
-                "linter": config.get("code_quality", {}).get("linter", "eslint"),
-                "type_checker": "typescript",
-                "test_framework": "jest",
-                "line_length": config.get("code_quality", {}).get("line_length", 80),
-                "node_version": config.get("code_quality", {}).get(
-                    "node_version", "20"
-                ),
-                "es_target": config.get("code_quality", {}).get("es_target", "ES2024"),
-                "author_name": config.get("author", "Your Name"),
-                "author_email": config.get("email", "your.email@example.com"),
-            },
-            "go": {
-                "formatter": "gofmt",
-                "linter": config.get("code_quality", {}).get("linter", "golangci-lint"),
-                "test_framework": "testing",
-                "go_version": config.get("code_quality", {}).get("go_version", "1.21"),
-                "author_name": config.get("author", "Your Name"),
-                "author_email": config.get("email", "your.email@example.com"),
-            },
-        }
+        configurable = _LANGUAGE_CONFIGURABLE_VARS.get(language)
+        if configurable is None:
+            base_vars = {}
+        else:
+            code_quality = config.get("code_quality") or {}
+            base_vars = dict(_LANGUAGE_FIXED_VARS[language])
+            for key, default in configurable.items():
+                base_vars[key] = code_quality.get(key, default)
 
-        base_vars = vars.get(language, {})
         base_vars.update(config)
 
         # Ensure the following variables are always available
@@ -762,43 +1088,29 @@ plugins:
     def _init_git_repo(self, path: Path, config: dict[str, Any]):
         """Initialize a git repository."""
         try:
-            # Check if git is available
-            import subprocess
-
-            result = subprocess.run(
-                ["git", "--version"], capture_output=True, text=True
-            )
-            if result.returncode != 0:
+            # Check if git is available without spawning a process
+            if shutil.which("git") is None:
                 logger.warning("Git not available, skipping repository initialization")
                 return
 
-            # Initialize git repository
-            subprocess.run(["git", "init"], cwd=path, check=True)
-
             # Create initial .gitignore
             gitignore_content = self._get_gitignore_content(path)
             if gitignore_content:
                 gitignore_path = path / ".gitignore"
-                with open(gitignore_path, "w") as f:
-                    f.write(gitignore_content)
+                _write_file(gitignore_path, gitignore_content.encode("utf-8"))
 
-            # Configure commit template if enabled
+            # Initialize the repository, configure the commit template if
+            # enabled and create the initial commit
+            commands = [["git", "init"]]
             if config.get("git_commit_template", False):
-                gitmessage_path = path / ".gitmessage"
-                if gitmessage_path.exists():
-                    subprocess.run(
-                        ["git", "config", "commit.template", ".gitmessage"],
-                        cwd=path,
-                        check=True,
-                    )
-
-            # Create initial commit
-            subprocess.run(["git", "add", "."], cwd=path, check=True)
-            subprocess.run(
-                ["git", "commit", "-m", "Initial commit with coding standards"],
-                cwd=path,
-                check=True,
+                if (path / ".gitmessage").exists():
+                    commands.append(["git", "config", "commit.template", ".gitmessage"])
+            commands.append(["git", "add", "."])
+            commands.append(
+                ["git", "commit", "-m", "Initial commit with coding standards"]
             )
+            for command in commands:
+                subprocess.run(command, cwd=path, check=True)
 
             logger.info("Git repository initialized")
 
@@ -807,139 +1119,23 @@ plugins:
 
     def _get_gitignore_content(self, path: Path) -> str:
         """Get appropriate .gitignore content for the project."""
-        # Detect project type and return appropriate .gitignore
-        if (path / "pyproject.toml").exists():
-            return """# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-MANIFEST
-
-# Virtual environments
-.env
-.venv
-env/
-venv/
-ENV/
-env.bak/
-venv.bak/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# Testing
-.coverage
-.pytest_cache/
-htmlcov/
-.tox/
-.nox/
-.coverage.*
-.cache
-nosetests.xml
-coverage.xml
-*.cover
-.hypothesis/
-
-# mypy
-.mypy_cache/
-.dmypy.json
-dmypy.json
-"""
-        elif (path / "package.json").exists():
-            return """# Dependencies
-node_modules/
-npm-debug.log*
-yarn-debug.log*
-yarn-error.log*
-
-# Production builds
-build/
-dist/
-.next/
-out/
-
-# Environment variables
-.env
-.env.local
-.env.development.local
-.env.test.local
-.env.production.local
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Logs
-logs
-*.log
-
-# Runtime data
-pids
-*.pid
-*.seed
-*.pid.lock
-
-# Coverage directory used by tools like istanbul
-coverage/
-.nyc_output
-
-# TypeScript
-*.tsbuildinfo
-"""
+        # Detect project type from a single directory listing
+        try:
+            names = set(os.listdir(path))
+        except OSError:
+            names = set()
+
+        if "pyproject.toml" in names:
+            return _GITIGNORE_PYTHON
+        elif "package.json" in names:
+            return _GITIGNORE_NODE
         else:
-            return """# General
-.DS_Store
-Thumbs.db
-*.log
-*.tmp
-*.temp
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# Build artifacts
-build/
-dist/
-target/
-"""
+            return _GITIGNORE_GENERAL
 
     def _install_pre_commit_hooks(self, path: Path, language: str):
         """Install pre-commit hooks for the project."""
         try:
             # Check if pre-commit is available
-            import subprocess
-
             result = subprocess.run(
                 ["pre-commit", "--version"], capture_output=True, text=True
             )
@@ -947,45 +1143,67 @@ target/
                 logger.warning("pre-commit not available, skipping hook installation")
                 return
 
-            # Install pre-commit hooks
-            subprocess.run(["pre-commit", "install"], cwd=path, check=True)
-
-            # Install additional hooks based on language
+            # Install pre-commit hooks, plus additional hooks based on language,
+            # in a single pre-commit run
+            command = ["pre-commit", "install", "--hook-type", "pre-commit"]
             if language == "python":
-                subprocess.run(
-                    ["pre-commit", "install", "--hook-type", "pre-push"],
-                    cwd=path,
-                    check=True,
-                )
+                command += ["--hook-type", "pre-push"]
+            subprocess.run(command, cwd=path, check=True)
 
             logger.info("Pre-commit hooks installed")
 
         except Exception as e:
             logger.warning(f"Failed to install pre-commit hooks: {e}")
 
+    def _try_load_template(
+        self, template_dir: Path
+    ) -> tuple[Optional[ProjectTemplate], Optional[Exception]]:
+        """Load a template, returning the error instead of raising it."""
+        try:
+            return self._load_template(template_dir), None
+        except Exception as e:
+            return None, e
+
     def list_templates(self) -> list[dict[str, Any]]:
         """List available project templates."""
         templates = []
 
-        for lang_dir in self.templates_path.iterdir():
-            if lang_dir.is_dir() and not lang_dir.name.startswith("."):
-                for template_dir in lang_dir.iterdir():
-                    if template_dir.is_dir():
-                        try:
-                            template = self._load_template(template_dir)
-                            templates.append(
-                                {
-                                    "name": template.name,
-                                    "language": lang_dir.name,
-                                    "description": template.description,
-                                    "path": str(
-                                        template_dir.relative_to(self.templates_path)
-                                    ),
-                                }
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to load template {template_dir}: {e}"
-                            )
+        # scandir entries carry the file type, so is_dir() needs no extra stat
+        with os.scandir(self.templates_path) as lang_entries:
+            lang_dirs = [
+                entry
+                for entry in lang_entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
+
+        candidates = []
+        for lang_dir in lang_dirs:
+            with os.scandir(lang_dir.path) as template_entries:
+                candidates.extend(
+                    (lang_dir, entry) for entry in template_entries if entry.is_dir()
+                )
+
+        # Loading is independent per template, so larger sets load in parallel
+        template_paths = [Path(template_dir.path) for _, template_dir in candidates]
+        if len(template_paths) > _PARALLEL_LOAD_THRESHOLD:
+            max_workers = min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._try_load_template, template_paths))
+        else:
+            results = [self._try_load_template(p) for p in template_paths]
+
+        for (lang_dir, template_dir), (template, error) in zip(candidates, results):
+            if error is not None:
+                logger.warning(f"Failed to load template {template_dir.path}: {error}")
+                continue
+
+            templates.append(
+                {
+                    "name": template.name,
+                    "language": lang_dir.name,
+                    "description": template.description,
+                    "path": os.path.join(lang_dir.name, template_dir.name),
+                }
+            )
 
         return templates
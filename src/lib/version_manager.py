@@ -2,7 +2,7 @@
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 import tomllib
 import tomli_w
 
@@ -22,6 +22,8 @@ class VersionManager:
         self.project_root = project_root or Path.cwd()
         self.versions_file = self.project_root / "src" / "versions.toml"
         self.console = Console()
+        # Writer used by _save_versions; tests can swap in a stub
+        self._dump = tomli_w.dump
 
         if not self.versions_file.exists():
             raise FileNotFoundError(f"Versions file not found: {self.versions_file}")
@@ -36,7 +38,7 @@ class VersionManager:
     def _save_versions(self) -> None:
         """Save the current versions configuration."""
         with open(self.versions_file, "wb") as f:
-            tomli_w.dump(self.versions, f)
+            self._dump(self.versions, f)
 
     def get_version(self, key: str) -> str:
         """Get a specific version by key."""
@@ -349,13 +351,14 @@ class VersionManager:
         return content
 
     def _update_file_content(
-        self, file_path: Path, patterns: List[Tuple[str, str]]
+        self, file_path: Path, patterns: List[Tuple[Union[str, re.Pattern[str]], str]]
     ) -> None:
         """Update file content using regex patterns.
 
         Args:
             file_path: Path to the file to update
-            patterns: List of (regex_pattern, replacement) tuples
+            patterns: List of (regex_pattern, replacement) tuples; patterns may be
+                strings or precompiled regular expressions
         """
         try:
             content = file_path.read_text()
@@ -2,11 +2,46 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock
 from typing import Dict, Any
 
+from rich.console import Console
+from rich.prompt import Confirm, IntPrompt, Prompt
+
 from src.cli.prompts import ProjectConfigurator
 from src.generators import ProjectGenerator
+from tests.utils import FakeRun
+
+# Mock fixtures whose call history is cleared after every test
+MOCK_FIXTURES = (
+    "mock_subprocess",
+    "mock_rich_console",
+    "mock_rich_prompt",
+    "mock_rich_confirm",
+    "mock_rich_int_prompt",
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless the run asks for them with --benchmark-only."""
+    if config.getoption("benchmark_only", default=False):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmarks run with --benchmark-only")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(request):
+    """Drop recorded calls on shared mocks so history never outlives a test."""
+    yield
+    for name in MOCK_FIXTURES:
+        mock = request.node.funcargs.get(name)
+        if isinstance(mock, FakeRun):
+            mock.reset()
+        elif mock is not None:
+            mock.reset_mock(return_value=False, side_effect=False)
 
 
 @pytest.fixture
@@ -17,9 +52,8 @@ def temp_project_dir(tmp_path: Path) -> Path:
     return project_dir
 
 
-@pytest.fixture
-def mock_config() -> Dict[str, Any]:
-    """Mock project configuration."""
+def _build_mock_config() -> Dict[str, Any]:
+    """Build a fresh project configuration for each fixture that needs one."""
     return {
         "name": "test-project",
         "language": "python",
@@ -58,46 +92,17 @@ def mock_config() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def mock_config() -> Dict[str, Any]:
+    """Mock project configuration."""
+    return _build_mock_config()
+
+
 @pytest.fixture
 def mock_project_configurator() -> ProjectConfigurator:
     """Mock ProjectConfigurator instance."""
     configurator = ProjectConfigurator()
-    configurator.config = {
-        "name": "test-project",
-        "language": "python",
-        "description": "A test project with coding standards",
-        "author": "Test Author",
-        "email": "test@example.com",
-        "license": "MIT",
-        "git_enabled": True,
-        "contributing_enabled": True,
-        "code_of_conduct_enabled": True,
-        "issue_templates_enabled": True,
-        "pr_templates_enabled": True,
-        "git_commit_template": True,
-        "ci_cd_enabled": False,
-        "documentation_enabled": False,
-        "security_enabled": False,
-        "contributing": {
-            "branch_strategy": "github-flow",
-            "conventional_commits": True,
-            "pr_required": True,
-            "review_required": True,
-            "reviewers_count": 1,
-            "issue_template_enabled": True,
-            "cla_required": False,
-        },
-        "code_quality": {
-            "pre_commit_enabled": True,
-            "testing_enabled": True,
-            "coverage_enabled": True,
-            "coverage_threshold": 80,
-            "formatter": "black",
-            "linter": "flake8",
-            "type_checker": "mypy",
-            "import_sorter": "isort",
-        },
-    }
+    configurator.config = _build_mock_config()
     return configurator
 
 
@@ -108,6 +113,12 @@ def mock_project_generator(tmp_path: Path) -> ProjectGenerator:
     return generator
 
 
+@pytest.fixture(scope="session")
+def default_generator() -> ProjectGenerator:
+    """ProjectGenerator over the bundled templates, shared by stateless tests."""
+    return ProjectGenerator()
+
+
 @pytest.fixture
 def mock_click_context() -> Mock:
     """Mock Click context for CLI commands."""
@@ -127,7 +138,7 @@ def mock_click_context() -> Mock:
 @pytest.fixture
 def mock_rich_console() -> Mock:
     """Mock Rich console for testing."""
-    console = Mock()
+    console = Mock(spec_set=Console)
     console.print = Mock()
     return console
 
@@ -135,7 +146,7 @@ def mock_rich_console() -> Mock:
 @pytest.fixture
 def mock_rich_prompt() -> Mock:
     """Mock Rich prompt for testing."""
-    prompt = Mock()
+    prompt = Mock(spec_set=Prompt)
     prompt.ask = Mock(return_value="test-value")
     return prompt
 
@@ -143,7 +154,7 @@ def mock_rich_prompt() -> Mock:
 @pytest.fixture
 def mock_rich_confirm() -> Mock:
     """Mock Rich confirm for testing."""
-    confirm = Mock()
+    confirm = Mock(spec_set=Confirm)
     confirm.ask = Mock(return_value=True)
     return confirm
 
@@ -151,24 +162,34 @@ def mock_rich_confirm() -> Mock:
 @pytest.fixture
 def mock_rich_int_prompt() -> Mock:
     """Mock Rich int prompt for testing."""
-    int_prompt = Mock()
+    int_prompt = Mock(spec_set=IntPrompt)
     int_prompt.ask = Mock(return_value=1)
     return int_prompt
 
 
 @pytest.fixture
-def mock_subprocess() -> Mock:
-    """Mock subprocess for testing."""
-    subprocess = Mock()
-    subprocess.run = Mock()
-    subprocess.run.return_value.returncode = 0
-    return subprocess
+def mock_subprocess(monkeypatch: pytest.MonkeyPatch) -> FakeRun:
+    """Replace subprocess.run with a recording FakeRun for the test.
 
+    External tools are also reported as installed so code that checks
+    shutil.which() before running them proceeds to the recorded calls.
+    """
+    fake_run = FakeRun()
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setattr("shutil.which", lambda cmd, *args, **kwargs: cmd)
+    return fake_run
 
-@pytest.fixture
-def sample_template_files(tmp_path: Path) -> Path:
+
+@pytest.fixture(scope="session")
+def sample_templates_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide templates root shared by the read-only template fixtures."""
+    return tmp_path_factory.mktemp("templates")
+
+
+@pytest.fixture(scope="session")
+def sample_template_files(sample_templates_dir: Path) -> Path:
     """Create sample template files for testing."""
-    templates_dir = tmp_path / "templates"
+    templates_dir = sample_templates_dir
     python_template = templates_dir / "python" / "default"
     python_template.mkdir(parents=True)
 
@@ -234,10 +255,10 @@ description = "{{ description }}"
     return templates_dir
 
 
-@pytest.fixture
-def sample_common_templates(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def sample_common_templates(sample_templates_dir: Path) -> Path:
     """Create sample common templates for testing."""
-    templates_dir = tmp_path / "templates"
+    templates_dir = sample_templates_dir
     common_dir = templates_dir / "common"
     common_dir.mkdir(parents=True)
 
@@ -331,3 +352,9 @@ Language: {{ language }}
     )
 
     return templates_dir
+
+
+@pytest.fixture(scope="session")
+def sample_generator(sample_template_files: Path) -> ProjectGenerator:
+    """ProjectGenerator over the sample templates, shared by read-only tests."""
+    return ProjectGenerator(sample_template_files)
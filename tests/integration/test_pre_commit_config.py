@@ -3,10 +3,10 @@
 import pytest
 import yaml
 from pathlib import Path
-from unittest.mock import patch, Mock
 from typing import Dict, Any
 
-from src.generators import ProjectGenerator
+# Resolve repository files independently of the worker's working directory
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 class TestPreCommitConfiguration:
@@ -15,8 +15,8 @@ class TestPreCommitConfiguration:
     def test_actual_template_does_not_contain_types_all(self):
         """Test that the actual pre-commit config template doesn't contain the problematic types-all package."""
         # Path to the actual template file
-        template_path = Path(
-            "src/templates/python/default/files/.pre-commit-config.yaml"
+        template_path = (
+            REPO_ROOT / "src/templates/python/default/files/.pre-commit-config.yaml"
         )
 
         # Verify the template file exists
@@ -69,8 +69,6 @@ class TestPreCommitConfiguration:
 
     def test_pre_commit_config_does_not_contain_types_all(self, tmp_path: Path):
         """Test that the generated pre-commit config doesn't contain the problematic types-all package."""
-        generator = ProjectGenerator()
-
         # Create a mock template structure
         template_dir = tmp_path / "templates" / "python" / "default"
         template_dir.mkdir(parents=True)
@@ -176,8 +174,6 @@ class TestPreCommitConfiguration:
 
     def test_pre_commit_config_validation(self, tmp_path: Path):
         """Test that the pre-commit configuration is valid YAML and has correct structure."""
-        generator = ProjectGenerator()
-
         # Create a mock template structure
         template_dir = tmp_path / "templates" / "python" / "default"
         template_dir.mkdir(parents=True)
@@ -247,15 +243,13 @@ class TestPreCommitConfiguration:
         assert "types-PyYAML" in mypy_hook["additional_dependencies"]
         assert "--ignore-missing-imports" in mypy_hook["args"]
 
-    @patch("subprocess.run")
     def test_pre_commit_install_without_types_all_error(
         self, mock_subprocess, tmp_path: Path
     ):
         """Test that pre-commit install doesn't fail due to types-all dependency issues."""
-        generator = ProjectGenerator()
+        from src.generators import ProjectGenerator
 
-        # Mock successful pre-commit install
-        mock_subprocess.return_value.returncode = 0
+        generator = ProjectGenerator()
 
         # Create a mock template structure
         template_dir = tmp_path / "templates" / "python" / "default"
@@ -300,12 +294,15 @@ class TestPreCommitConfiguration:
             generator._install_pre_commit_hooks(tmp_path, "python")
 
             # Verify pre-commit install was called
-            pre_commit_calls = [
-                call
-                for call in mock_subprocess.call_args_list
-                if "pre-commit" in str(call)
-            ]
-            assert len(pre_commit_calls) >= 2  # install + pre-push
+            cmds = mock_subprocess.commands
+            assert (
+                "pre-commit",
+                "install",
+                "--hook-type",
+                "pre-commit",
+                "--hook-type",
+                "pre-push",
+            ) in cmds
 
         except Exception as e:
             # If there's an error, it shouldn't be related to types-all
@@ -319,8 +316,6 @@ class TestPreCommitConfiguration:
 
     def test_pre_commit_config_uses_correct_mypy_version(self, tmp_path: Path):
         """Test that the pre-commit config uses a recent mypy version."""
-        generator = ProjectGenerator()
-
         # Create a mock template structure
         template_dir = tmp_path / "templates" / "python" / "default"
         template_dir.mkdir(parents=True)
@@ -371,8 +366,6 @@ class TestPreCommitConfiguration:
 
     def test_pre_commit_config_has_required_hooks(self, tmp_path: Path):
         """Test that the pre-commit configuration includes all required hooks."""
-        generator = ProjectGenerator()
-
         # Create a mock template structure
         template_dir = tmp_path / "templates" / "python" / "default"
         template_dir.mkdir(parents=True)
@@ -15,34 +15,60 @@ def run_tests():
     print(f"📁 Project root: {project_root}")
     print()
 
-    # Run unit tests
+    # Run unit and integration tests concurrently; the groups are independent
     print("🔬 Running unit tests...")
-    unit_result = subprocess.run(
-        [sys.executable, "-m", "pytest", "tests/unit/", "-v", "--tb=short"],
+    unit_proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "tests/unit/",
+            "-v",
+            "--tb=short",
+            "-n",
+            "auto",
+            "--durations=10",
+        ],
         cwd=project_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
     )
 
-    print()
-
-    # Run integration tests
     print("🔗 Running integration tests...")
-    integration_result = subprocess.run(
-        [sys.executable, "-m", "pytest", "tests/integration/", "-v", "--tb=short"],
+    integration_proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "tests/integration/",
+            "-v",
+            "--tb=short",
+            "-n",
+            "auto",
+            "--durations=10",
+        ],
         cwd=project_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
     )
 
+    unit_output, _ = unit_proc.communicate()
+    integration_output, _ = integration_proc.communicate()
+
     print()
+    print(unit_output)
+    print(integration_output)
 
     # Summary
     print("📊 Test Results Summary:")
+    print(f"   Unit tests: {'✅ PASSED' if unit_proc.returncode == 0 else '❌ FAILED'}")
     print(
-        f"   Unit tests: {'✅ PASSED' if unit_result.returncode == 0 else '❌ FAILED'}"
-    )
-    print(
-        f"   Integration tests: {'✅ PASSED' if integration_result.returncode == 0 else '❌ FAILED'}"
+        f"   Integration tests: {'✅ PASSED' if integration_proc.returncode == 0 else '❌ FAILED'}"
     )
 
-    if unit_result.returncode == 0 and integration_result.returncode == 0:
+    if unit_proc.returncode == 0 and integration_proc.returncode == 0:
         print("\n🎉 All tests passed!")
         return 0
     else:
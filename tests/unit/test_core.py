@@ -1,16 +1,43 @@
 """Tests for the core module."""
 
+import os
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, mock_open, patch
 
 from src.core import (
     StandardsManager,
     StandardsConfig,
     StandardMetadata,
     ValidationResult,
+    _load_config_file,
 )
 
+_MOCK_METADATA = {
+    "name": "python",
+    "version": "1.0.0",
+    "description": "Python standards",
+    "languages": ["python"],
+    "last_updated": "2024-01-01",
+    "maintainer": "Team",
+}
+
+
+@pytest.fixture(scope="module")
+def default_manager() -> StandardsManager:
+    """StandardsManager with the bundled standards, shared by read-only tests."""
+    return StandardsManager()
+
+
+@pytest.fixture
+def mock_metadata_loader():
+    """Serve _MOCK_METADATA for every metadata.json read."""
+    with (
+        patch("json.load", return_value=_MOCK_METADATA),
+        patch("builtins.open", mock_open()),
+    ):
+        yield
+
 
 class TestStandardsConfig:
     """Test StandardsConfig class."""
@@ -70,13 +97,11 @@ class TestValidationResult:
 class TestStandardsManager:
     """Test StandardsManager class."""
 
-    def test_standards_manager_creation(self):
+    def test_standards_manager_creation(self, default_manager):
         """Test creating a StandardsManager instance."""
-        manager = StandardsManager()
-
-        assert manager.standards_path is not None
-        assert isinstance(manager.config, StandardsConfig)
-        assert manager.standards_cache == {}
+        assert default_manager.standards_path is not None
+        assert isinstance(default_manager.config, StandardsConfig)
+        assert default_manager.standards_cache == {}
 
     def test_standards_manager_custom_path(self, tmp_path):
         """Test creating StandardsManager with custom path."""
@@ -105,13 +130,48 @@ class TestStandardsManager:
         assert manager.config.strict_mode is True
         assert manager.config.auto_fix is False
 
-    def test_load_config_defaults(self):
-        """Test loading default config when no file exists."""
-        manager = StandardsManager()
+    @patch("src.core.toml.load")
+    def test_load_config_parsed_once_per_file(self, mock_toml_load, tmp_path):
+        """Test config.toml is parsed once until the file changes."""
+        mock_toml_load.return_value = {"version": "2.0.0"}
 
-        assert manager.config.version == "0.0.1"
-        assert "python" in manager.config.languages
-        assert "typescript" in manager.config.languages
+        config_file = tmp_path / "config.toml"
+        config_file.touch()
+
+        first = StandardsManager(standards_path=tmp_path)
+        second = StandardsManager(standards_path=tmp_path)
+
+        assert mock_toml_load.call_count == 1
+        assert first.config == second.config
+        assert first.config is not second.config
+
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        StandardsManager(standards_path=tmp_path)
+
+        assert mock_toml_load.call_count == 2
+
+    @patch("src.core.toml.load")
+    def test_load_config_cache_is_bounded(self, mock_toml_load, tmp_path):
+        """Test repeated config edits do not grow the parse cache without bound."""
+        mock_toml_load.return_value = {"version": "2.0.0"}
+
+        config_file = tmp_path / "config.toml"
+        config_file.touch()
+        stat = config_file.stat()
+
+        for offset in range(20):
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset))
+            StandardsManager(standards_path=tmp_path)
+
+        assert mock_toml_load.call_count == 20
+        assert _load_config_file.cache_info().currsize <= 8
+
+    def test_load_config_defaults(self, default_manager):
+        """Test loading default config when no file exists."""
+        assert default_manager.config.version == "0.0.1"
+        assert "python" in default_manager.config.languages
+        assert "typescript" in default_manager.config.languages
 
     def test_get_available_standards_no_standards(self, tmp_path):
         """Test getting available standards when none exist."""
@@ -120,20 +180,8 @@ class TestStandardsManager:
 
         assert standards == []
 
-    @patch("builtins.open")
-    @patch("json.load")
-    def test_get_available_standards(self, mock_json_load, mock_open, tmp_path):
+    def test_get_available_standards(self, mock_metadata_loader, tmp_path):
         """Test getting available standards."""
-        mock_metadata = {
-            "name": "python",
-            "version": "1.0.0",
-            "description": "Python standards",
-            "languages": ["python"],
-            "last_updated": "2024-01-01",
-            "maintainer": "Team",
-        }
-        mock_json_load.return_value = mock_metadata
-
         # Create standards directory structure
         python_dir = tmp_path / "python"
         python_dir.mkdir()
@@ -147,38 +195,34 @@ class TestStandardsManager:
         assert standards[0].name == "python"
         assert standards[0].version == "1.0.0"
 
-    def test_get_standard_not_found(self):
+    def test_get_standard_not_found(self, default_manager):
         """Test getting a standard that doesn't exist."""
-        manager = StandardsManager()
-
         with pytest.raises(
             ValueError, match="Standards for language 'nonexistent' not found"
         ):
-            manager.get_standard("nonexistent")
+            default_manager.get_standard("nonexistent")
 
-    def test_detect_languages_python(self, tmp_path):
+    def test_detect_languages_python(self, default_manager, tmp_path):
         """Test detecting Python language."""
         # Create pyproject.toml
         pyproject_file = tmp_path / "pyproject.toml"
         pyproject_file.touch()
 
-        manager = StandardsManager()
-        languages = manager._detect_languages(tmp_path)
+        languages = default_manager._detect_languages(tmp_path)
 
         assert "python" in languages
 
-    def test_detect_languages_typescript(self, tmp_path):
+    def test_detect_languages_typescript(self, default_manager, tmp_path):
         """Test detecting TypeScript language."""
         # Create package.json
         package_file = tmp_path / "package.json"
         package_file.touch()
 
-        manager = StandardsManager()
-        languages = manager._detect_languages(tmp_path)
+        languages = default_manager._detect_languages(tmp_path)
 
         assert "typescript" in languages
 
-    def test_detect_languages_multiple(self, tmp_path):
+    def test_detect_languages_multiple(self, default_manager, tmp_path):
         """Test detecting multiple languages."""
         # Create both Python and TypeScript files
         pyproject_file = tmp_path / "pyproject.toml"
@@ -186,18 +230,18 @@ class TestStandardsManager:
         package_file = tmp_path / "package.json"
         package_file.touch()
 
-        manager = StandardsManager()
-        languages = manager._detect_languages(tmp_path)
+        with patch("src.core.os.scandir", wraps=os.scandir) as mock_scandir:
+            languages = default_manager._detect_languages(tmp_path)
 
         assert "python" in languages
         assert "typescript" in languages
+        # All markers are resolved from a single directory listing
+        mock_scandir.assert_called_once_with(tmp_path)
 
-    def test_validate_project_path_not_exists(self):
+    def test_validate_project_path_not_exists(self, default_manager):
         """Test validating a project that doesn't exist."""
-        manager = StandardsManager()
-
         with pytest.raises(ValueError, match="Project path does not exist"):
-            manager.validate_project("/nonexistent/path")
+            default_manager.validate_project("/nonexistent/path")
 
     @patch.object(StandardsManager, "_validate_language")
     def test_validate_project_success(self, mock_validate_language, tmp_path):
@@ -242,9 +286,7 @@ class TestStandardsManager:
         assert result.score < 100.0
         assert len(result.violations) == 1
 
-    def test_update_project_standards_path_not_exists(self):
+    def test_update_project_standards_path_not_exists(self, default_manager):
         """Test updating standards for a project that doesn't exist."""
-        manager = StandardsManager()
-
         with pytest.raises(ValueError, match="Project path does not exist"):
-            manager.update_project_standards("/nonexistent/path")
+            default_manager.update_project_standards("/nonexistent/path")
@@ -1,7 +1,182 @@
 """Unit tests for the CLI init command."""
 
+from contextlib import ExitStack
+from functools import partial
+from types import SimpleNamespace
+
+import click
+import pytest
+from unittest.mock import patch
+
+from src.cli.commands.project.init import init_project
+
+INIT_MODULE = "src.cli.commands.project.init"
+
+# The init callback with the arguments Click passes when no options are given;
+# tests pass only the arguments they change
+run_init = partial(
+    init_project.callback,
+    language="python",
+    name="test-project",
+    path=None,
+    template=None,
+    force=False,
+    interactive=True,
+    non_interactive=False,
+)
+
+
+@pytest.fixture(scope="module")
+def _init_patches():
+    """Patch the generator, configurator and error handler once per module."""
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            generator=stack.enter_context(patch(f"{INIT_MODULE}.ProjectGenerator")),
+            configurator=stack.enter_context(
+                patch(f"{INIT_MODULE}.ProjectConfigurator")
+            ),
+            # The real handler prints the error and aborts
+            handle_error=stack.enter_context(
+                patch(f"{INIT_MODULE}.handle_generic_error", side_effect=click.Abort)
+            ),
+        )
+
 
 class TestInitCommand:
     """Test the init command."""
 
-    pass
+    @pytest.fixture(autouse=True)
+    def mocks(self, _init_patches, mock_config):
+        """Clear the shared patches' call history and seed default return values."""
+        for mock in vars(_init_patches).values():
+            mock.reset_mock()
+
+        _init_patches.generator.return_value.create_project.return_value = True
+        _init_patches.configurator.return_value.configure_project.return_value = (
+            mock_config
+        )
+        return _init_patches
+
+    def test_init_project_non_interactive_features(self, mocks, tmp_path):
+        """Test non-interactive init passes the default feature set to the generator."""
+        run_init(path=tmp_path, non_interactive=True)
+
+        mocks.configurator.assert_not_called()
+        call_kwargs = mocks.generator.return_value.create_project.call_args.kwargs
+        assert call_kwargs["path"] == tmp_path / "test-project"
+        assert call_kwargs["language"] == "python"
+
+        config = call_kwargs["config"]
+        assert config["contributing_enabled"] is True
+        assert config["code_of_conduct_enabled"] is True
+        assert config["issue_templates_enabled"] is True
+        assert config["pr_templates_enabled"] is True
+        assert config["ci_cd_enabled"] is False
+        assert config["documentation_enabled"] is False
+
+    def test_init_project_interactive_features(self, mocks, tmp_path, mock_config):
+        """Test interactive init hands the configured features to the generator."""
+        mock_config["ci_cd_enabled"] = True
+        mock_config["documentation_enabled"] = True
+
+        run_init(path=tmp_path)
+
+        mocks.configurator.return_value.configure_project.assert_called_once_with(
+            "python", "test-project"
+        )
+        call_kwargs = mocks.generator.return_value.create_project.call_args.kwargs
+        config = call_kwargs["config"]
+        assert config["ci_cd_enabled"] is True
+        assert config["documentation_enabled"] is True
+        assert config["contributing"]["branch_strategy"] == "github-flow"
+
+    def test_init_project_default_path(self, mocks, tmp_path, monkeypatch):
+        """Test project path defaults to the current directory."""
+        monkeypatch.chdir(tmp_path)
+
+        run_init()
+
+        call_kwargs = mocks.generator.return_value.create_project.call_args.kwargs
+        assert call_kwargs["path"] == tmp_path / "test-project"
+
+    @pytest.mark.parametrize(
+        "option, value",
+        [
+            pytest.param("template", "custom-template", id="template"),
+            pytest.param("force", True, id="force"),
+        ],
+    )
+    def test_init_project_option_passthrough(self, mocks, tmp_path, option, value):
+        """Test command options are passed through to the generator."""
+        run_init(path=tmp_path, **{option: value})
+
+        call_kwargs = mocks.generator.return_value.create_project.call_args.kwargs
+        assert call_kwargs[option] == value
+
+    def test_init_project_generator_failure(self, mocks, tmp_path):
+        """Test init aborts when the generator reports a failure."""
+        mocks.generator.return_value.create_project.return_value = False
+
+        with pytest.raises(click.Abort):
+            run_init(path=tmp_path)
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            pytest.param("name", "config-name", id="name"),
+            pytest.param("language", "typescript", id="language"),
+        ],
+    )
+    def test_init_project_interactive_selection_from_config(
+        self, mocks, tmp_path, mock_config, field, value
+    ):
+        """Test a name or language selected interactively is used for the project."""
+        mock_config[field] = value
+        run_init(path=tmp_path, **{field: None})
+
+        call_kwargs = mocks.generator.return_value.create_project.call_args.kwargs
+        assert call_kwargs["path"] == tmp_path / mock_config["name"]
+        assert call_kwargs["language"] == mock_config["language"]
+
+    @pytest.mark.parametrize(
+        "missing, non_interactive, message",
+        [
+            pytest.param(
+                "name",
+                True,
+                "Project name must be specified when using",
+                id="name-non-interactive",
+            ),
+            pytest.param(
+                "language",
+                True,
+                "Language must be specified when using",
+                id="language-non-interactive",
+            ),
+            pytest.param(
+                "name",
+                False,
+                "Project name must be specified or selected interactively",
+                id="name-interactive",
+            ),
+            pytest.param(
+                "language",
+                False,
+                "Language must be specified or selected interactively",
+                id="language-interactive",
+            ),
+        ],
+    )
+    def test_init_project_missing_argument(
+        self, mocks, tmp_path, mock_config, missing, non_interactive, message
+    ):
+        """Test init requires a name and language, given or selected interactively."""
+        mock_config[missing] = None
+
+        with pytest.raises(click.Abort):
+            run_init(path=tmp_path, non_interactive=non_interactive, **{missing: None})
+
+        error = mocks.handle_error.call_args.args[0]
+        assert isinstance(error, click.UsageError)
+        assert message in str(error)
+        mocks.generator.assert_not_called()
@@ -0,0 +1,190 @@
+"""Unit tests for the shared test helpers."""
+
+import os
+import subprocess
+
+import pytest
+
+from tests.utils import (
+    FakeRun,
+    assert_file_contains,
+    assert_file_exists,
+    assert_project_structure,
+    create_mock_click_context,
+    create_mock_project_structure,
+    mock_git_commands,
+    mock_pre_commit_commands,
+    mock_rich_prompt_responses,
+    mock_subprocess_commands,
+    snapshot_tree,
+)
+
+
+class TestCreateMockProjectStructure:
+    """Test create_mock_project_structure."""
+
+    def test_nested_structure(self, tmp_path):
+        """Test dicts, file contents and list entries are all created."""
+        create_mock_project_structure(
+            tmp_path,
+            {
+                "src": {"pkg": {"__init__.py": "x = 1"}, "empty": {}},
+                "docs": ["guide/", "index.md"],
+                "README.md": "readme",
+            },
+        )
+
+        assert snapshot_tree(tmp_path) == {
+            "src/pkg/__init__.py": b"x = 1",
+            "docs/index.md": b"",
+            "README.md": b"readme",
+        }
+        assert (tmp_path / "src" / "empty").is_dir()
+        assert (tmp_path / "docs" / "guide").is_dir()
+
+    def test_nested_list_entries(self, tmp_path):
+        """Test list entries may point into subdirectories that do not exist yet."""
+        create_mock_project_structure(tmp_path, {"pkg": ["sub/mod.py", "a/b/"]})
+
+        assert (tmp_path / "pkg" / "sub" / "mod.py").is_file()
+        assert (tmp_path / "pkg" / "a" / "b").is_dir()
+
+    def test_trailing_slash_keys(self, tmp_path):
+        """Test dict keys may carry a trailing slash."""
+        create_mock_project_structure(tmp_path, {"src/": {"pkg/": {"mod.py": "m"}}})
+
+        assert (tmp_path / "src" / "pkg" / "mod.py").read_text() == "m"
+
+
+class TestFileAssertions:
+    """Test assert_file_exists and assert_file_contains."""
+
+    def test_assert_file_exists_compares_bytes(self, tmp_path):
+        """Test expected text is compared with the file's UTF-8 bytes."""
+        path = tmp_path / "note.txt"
+        path.write_bytes("héllo".encode("utf-8"))
+
+        assert_file_exists(path)
+        assert_file_exists(path, "héllo")
+        with pytest.raises(AssertionError, match="content mismatch"):
+            assert_file_exists(path, "hello")
+
+    def test_assert_file_exists_sees_rewrites(self, tmp_path):
+        """Test a rewrite that keeps the mtime is still seen."""
+        path = tmp_path / "note.txt"
+        path.write_text("aaa")
+        assert_file_exists(path, "aaa")
+
+        stat = path.stat()
+        path.write_text("bbb")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert_file_exists(path, "bbb")
+
+    def test_assert_file_exists_missing(self, tmp_path):
+        """Test a missing file is reported."""
+        with pytest.raises(AssertionError, match="does not exist"):
+            assert_file_exists(tmp_path / "missing.txt")
+
+    def test_assert_file_contains(self, tmp_path):
+        """Test substring checks on file contents."""
+        path = tmp_path / "note.txt"
+        path.write_text("name = 'café'\n")
+
+        assert_file_contains(path, "café")
+        with pytest.raises(AssertionError, match="not found"):
+            assert_file_contains(path, "tea")
+
+
+class TestMockHelpers:
+    """Test the prompt, subprocess and Click mock helpers."""
+
+    def test_mock_rich_prompt_responses(self):
+        """Test responses are routed by key prefix."""
+        mocks = mock_rich_prompt_responses(
+            prompt_name="demo", confirm_git=False, int_choice=2, other=1
+        )
+
+        assert mocks["Prompt"].ask() == "demo"
+        assert mocks["Confirm"].ask() is False
+        assert mocks["IntPrompt"].ask() == 2
+
+    def test_mock_rich_prompt_responses_are_independent(self):
+        """Test each call returns its own mocks."""
+        first = mock_rich_prompt_responses(prompt_name="first")
+        second = mock_rich_prompt_responses(prompt_name="second")
+
+        assert first["Prompt"] is not second["Prompt"]
+        assert first["Prompt"].ask() == "first"
+        assert second["Prompt"].ask() == "second"
+
+    @pytest.mark.parametrize(
+        "helper",
+        [mock_subprocess_commands, mock_git_commands, mock_pre_commit_commands],
+    )
+    def test_command_mocks_record_calls(self, helper):
+        """Test the command helpers patch in a recording FakeRun."""
+        original = subprocess.run
+        with helper() as fake_run:
+            result = subprocess.run(["git", "init"], check=True)
+
+        assert isinstance(fake_run, FakeRun)
+        assert result.returncode == 0
+        assert fake_run.commands == {("git", "init")}
+        assert subprocess.run is original
+
+    def test_create_mock_click_context(self):
+        """Test defaults are applied and overrides stay per context."""
+        context = create_mock_click_context(force=True)
+        default = create_mock_click_context()
+
+        assert context.params["force"] is True
+        assert context.params["language"] == "python"
+        assert default.params["force"] is False
+        assert context.params is not default.params
+
+
+class TestAssertProjectStructure:
+    """Test assert_project_structure."""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create a small project tree."""
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "__init__.py").write_text("VERSION = 1\n")
+        (tmp_path / "docs" / "guide").mkdir(parents=True)
+        (tmp_path / "README.md").write_text("# Project\n")
+        return tmp_path
+
+    def test_matching_structure(self, project):
+        """Test a spec mixing nested dicts, lists and file contents passes."""
+        assert_project_structure(
+            project,
+            {
+                "src": {"pkg": {"__init__.py": "VERSION"}},
+                "docs": ["guide/"],
+                "README.md": "",
+            },
+        )
+
+    def test_trailing_slash_keys(self, project):
+        """Test dict keys may carry a trailing slash."""
+        assert_project_structure(project, {"src/": {"pkg/": {"__init__.py": ""}}})
+
+    def test_list_entries_only_need_to_exist(self, project):
+        """Test list entries without a trailing slash may name directories."""
+        assert_project_structure(project, {"src": ["pkg", "pkg/__init__.py"]})
+
+    @pytest.mark.parametrize(
+        "spec, message",
+        [
+            pytest.param({"missing.txt": ""}, "does not exist", id="missing-file"),
+            pytest.param({"docs": ["api/"]}, "does not exist", id="missing-dir"),
+            pytest.param({"README.md": {}}, "is not a directory", id="file-as-dir"),
+            pytest.param({"README.md": "Other"}, "not found in", id="content"),
+        ],
+    )
+    def test_mismatch_fails(self, project, spec, message):
+        """Test missing entries, wrong kinds and missing content are reported."""
+        with pytest.raises(AssertionError, match=message):
+            assert_project_structure(project, spec)
@@ -1,56 +1,81 @@
 """Unit tests for the version manager."""
 
+import copy
+import re
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from src.lib.version_manager import VersionManager
 
 
+PYTHON_VERSION_RE = re.compile(r'python_version\s*=\s*"[^"]*"')
+TARGET_VERSION_RE = re.compile(r"target_version\s*=\s*\[[^\]]*\]")
+CONFIG_CONTENT = b'python_version = "3.13"\ntarget_version = ["py313"]'
+
+# Versions data the manager is loaded with; the versions table is copied per test
+VERSIONS_DATA = {
+    "versions": {
+        "project": "0.0.1",
+        "python": "3.13",
+        "python_min": "3.11",
+        "python_target": "py313",
+        "node": "24",
+        "node_min": "22",
+    },
+    "file_patterns": {
+        "python_configs": [
+            "pyproject.toml",
+            "src/standards/python/config.toml",
+        ],
+        "typescript_configs": ["src/standards/typescript/config.toml"],
+        "project_configs": ["src/standards/config.toml", "src/__init__.py"],
+        "scripts": ["install.sh"],
+        "templates": ["src/generators.py"],
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def _version_manager_template(tmp_path_factory):
+    """VersionManager built once per module over a stub versions file."""
+    project_root = tmp_path_factory.mktemp("project")
+    versions_file = project_root / "src" / "versions.toml"
+    versions_file.parent.mkdir(parents=True)
+    versions_file.touch()
+
+    with patch("src.lib.version_manager.tomllib.load", return_value=VERSIONS_DATA):
+        return VersionManager(project_root)
+
+
+def _mock_methods(manager, *names):
+    """Replace the named methods on a per-test manager copy with mocks."""
+    mocks = SimpleNamespace(**{name: Mock() for name in names})
+    vars(manager).update(vars(mocks))
+    return mocks
+
+
 class TestVersionManager:
     """Test cases for VersionManager class."""
 
     @pytest.fixture
-    def mock_versions_data(self):
-        """Mock versions data for testing."""
-        return {
-            "versions": {
-                "project": "0.0.1",
-                "python": "3.13",
-                "python_min": "3.11",
-                "python_target": "py313",
-                "node": "24",
-                "node_min": "22",
-            },
-            "file_patterns": {
-                "python_configs": [
-                    "pyproject.toml",
-                    "src/standards/python/config.toml",
-                ],
-                "typescript_configs": ["src/standards/typescript/config.toml"],
-                "project_configs": ["src/standards/config.toml", "src/__init__.py"],
-                "scripts": ["install.sh"],
-                "templates": ["src/generators.py"],
-            },
+    def version_manager(self, _version_manager_template):
+        """Create a VersionManager instance for testing."""
+        manager = copy.copy(_version_manager_template)
+        # Only the versions table is ever written; file patterns are shared
+        manager.versions = {
+            "versions": dict(VERSIONS_DATA["versions"]),
+            "file_patterns": VERSIONS_DATA["file_patterns"],
         }
+        return manager
 
     @pytest.fixture
-    def version_manager(self, mock_versions_data, tmp_path):
-        """Create a VersionManager instance for testing."""
-        with patch("src.lib.version_manager.tomllib.load") as mock_load:
-            mock_load.return_value = mock_versions_data
-
-            # Create a mock versions file
-            versions_file = tmp_path / "src" / "versions.toml"
-            versions_file.parent.mkdir(parents=True)
-            versions_file.touch()
-
-            with patch("src.lib.version_manager.Path") as mock_path:
-                mock_path.return_value = tmp_path
-                mock_path.cwd.return_value = tmp_path
-
-                manager = VersionManager()
-                manager.versions = mock_versions_data
-                return manager
+    def config_file(self, tmp_path):
+        """Write the sample config into this test's tmp_path."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(CONFIG_CONTENT)
+        return test_file
 
     def test_get_version(self, version_manager):
         """Test getting a version by key."""
@@ -60,147 +85,145 @@ class TestVersionManager:
 
     def test_set_version(self, version_manager):
         """Test setting a version by key."""
-        with patch("src.lib.version_manager.tomli_w.dump") as mock_dump:
-            version_manager.set_version("python", "3.14")
-            assert version_manager.versions["versions"]["python"] == "3.14"
-            mock_dump.assert_called_once()
+        version_manager._dump = Mock()
+
+        version_manager.set_version("python", "3.14")
+
+        assert version_manager.versions["versions"]["python"] == "3.14"
+        version_manager._dump.assert_called_once()
 
     def test_validate_versions_valid(self, version_manager):
         """Test version validation with valid versions."""
         errors = version_manager.validate_versions()
         assert len(errors) == 0
 
-    def test_validate_versions_invalid_python(self, version_manager):
-        """Test version validation with invalid Python version."""
-        version_manager.versions["versions"]["python"] = "3.10"  # Below minimum
-        errors = version_manager.validate_versions()
-        assert len(errors) == 1
-        assert "Python version 3.10 is below minimum 3.11" in errors[0]
-
-    def test_validate_versions_invalid_node(self, version_manager):
-        """Test version validation with invalid Node.js version."""
-        version_manager.versions["versions"]["node"] = "20"  # Below minimum
+    @pytest.mark.parametrize(
+        "key, value, message",
+        [
+            pytest.param(
+                "python",
+                "3.10",
+                "Python version 3.10 is below minimum 3.11",
+                id="python",
+            ),
+            pytest.param(
+                "node", "20", "Node.js version 20 is below minimum 22", id="node"
+            ),
+        ],
+    )
+    def test_validate_versions_below_minimum(
+        self, version_manager, key, value, message
+    ):
+        """Test version validation reports versions below their minimum."""
+        version_manager.versions["versions"][key] = value
         errors = version_manager.validate_versions()
         assert len(errors) == 1
-        assert "Node.js version 20 is below minimum 22" in errors[0]
+        assert message in errors[0]
 
-    @patch("src.lib.version_manager.Path")
-    def test_update_python_version(self, mock_path, version_manager, tmp_path):
+    def test_update_python_version(self, version_manager):
         """Test updating Python version."""
-        mock_path.return_value = tmp_path
-
-        with (
-            patch.object(
-                version_manager, "_update_python_configs"
-            ) as mock_update_configs,
-            patch.object(
-                version_manager, "_update_install_script"
-            ) as mock_update_script,
-            patch.object(
-                version_manager, "_update_generators"
-            ) as mock_update_generators,
-        ):
-
-            version_manager.update_python_version("3.14")
-
-            assert version_manager.versions["versions"]["python"] == "3.14"
-            assert version_manager.versions["versions"]["python_target"] == "py314"
-            mock_update_configs.assert_called_once_with("3.14", "py314")
-            mock_update_script.assert_called_once_with("3.14")
-            mock_update_generators.assert_called_once_with("3.14", "python")
-
-    @patch("src.lib.version_manager.Path")
-    def test_update_node_version(self, mock_path, version_manager, tmp_path):
+        mocks = _mock_methods(
+            version_manager,
+            "_update_python_configs",
+            "_update_install_script",
+            "_update_generators",
+        )
+        version_manager.update_python_version("3.14")
+
+        assert version_manager.versions["versions"]["python"] == "3.14"
+        assert version_manager.versions["versions"]["python_target"] == "py314"
+        mocks._update_python_configs.assert_called_once_with("3.14", "py314")
+        mocks._update_install_script.assert_called_once_with("3.14")
+        mocks._update_generators.assert_called_once_with("3.14", "python")
+
+    def test_update_node_version(self, version_manager):
         """Test updating Node.js version."""
-        mock_path.return_value = tmp_path
+        mocks = _mock_methods(
+            version_manager, "_update_typescript_configs", "_update_generators"
+        )
+        version_manager.update_node_version("26")
 
-        with (
-            patch.object(
-                version_manager, "_update_typescript_configs"
-            ) as mock_update_configs,
-            patch.object(
-                version_manager, "_update_generators"
-            ) as mock_update_generators,
-        ):
+        assert version_manager.versions["versions"]["node"] == "26"
+        mocks._update_typescript_configs.assert_called_once_with("26")
+        mocks._update_generators.assert_called_once_with("26", "node")
 
-            version_manager.update_node_version("26")
-
-            assert version_manager.versions["versions"]["node"] == "26"
-            mock_update_configs.assert_called_once_with("26")
-            mock_update_generators.assert_called_once_with("26", "node")
-
-    @patch("src.lib.version_manager.Path")
-    def test_update_project_version(self, mock_path, version_manager, tmp_path):
+    def test_update_project_version(self, version_manager):
         """Test updating project version."""
-        mock_path.return_value = tmp_path
-
-        with patch.object(
-            version_manager, "_update_project_configs"
-        ) as mock_update_configs:
-
-            version_manager.update_project_version("0.3.0")
+        mocks = _mock_methods(version_manager, "_update_project_configs")
+        version_manager.update_project_version("0.3.0")
 
-            assert version_manager.versions["versions"]["project"] == "0.3.0"
-            mock_update_configs.assert_called_once_with("0.3.0")
+        assert version_manager.versions["versions"]["project"] == "0.3.0"
+        mocks._update_project_configs.assert_called_once_with("0.3.0")
 
-    def test_update_file_content(self, version_manager, tmp_path):
+    def test_update_file_content(self, version_manager, config_file):
         """Test updating file content with regex patterns."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text('python_version = "3.13"\ntarget_version = ["py313"]')
-
         patterns = [
-            (r'python_version\s*=\s*"[^"]*"', 'python_version = "3.14"'),
-            (r"target_version\s*=\s*\[[^\]]*\]", 'target_version = ["py314"]'),
+            (PYTHON_VERSION_RE, 'python_version = "3.14"'),
+            (TARGET_VERSION_RE, 'target_version = ["py314"]'),
         ]
 
-        version_manager._update_file_content(test_file, patterns)
+        version_manager._update_file_content(config_file, patterns)
 
-        content = test_file.read_text()
+        content = config_file.read_text()
         assert 'python_version = "3.14"' in content
         assert 'target_version = ["py314"]' in content
 
-    def test_update_file_content_no_changes(self, version_manager, tmp_path):
+    def test_update_file_content_no_changes(self, version_manager, config_file):
         """Test updating file content when no changes are needed."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text('python_version = "3.13"')
-
-        patterns = [
-            (r'python_version\s*=\s*"[^"]*"', 'python_version = "3.13"')  # Same version
-        ]
+        patterns = [(PYTHON_VERSION_RE, 'python_version = "3.13"')]  # Same version
 
         # Should not raise an error
-        version_manager._update_file_content(test_file, patterns)
+        version_manager._update_file_content(config_file, patterns)
 
         # Content should remain the same
-        assert test_file.read_text() == 'python_version = "3.13"'
+        assert config_file.read_bytes() == CONFIG_CONTENT
 
     def test_update_all_versions(self, version_manager):
         """Test updating multiple versions at once."""
-        with (
-            patch.object(version_manager, "update_python_version") as mock_python,
-            patch.object(version_manager, "update_node_version") as mock_node,
-            patch.object(version_manager, "validate_versions") as mock_validate,
-        ):
+        mocks = _mock_methods(
+            version_manager,
+            "update_python_version",
+            "update_node_version",
+            "validate_versions",
+        )
+        mocks.validate_versions.return_value = []
 
-            mock_validate.return_value = []
+        version_manager.update_all_versions(python="3.14", node="26")
 
-            version_manager.update_all_versions(python="3.14", node="26")
-
-            mock_python.assert_called_once_with("3.14")
-            mock_node.assert_called_once_with("26")
-            mock_validate.assert_called_once()
+        mocks.update_python_version.assert_called_once_with("3.14")
+        mocks.update_node_version.assert_called_once_with("26")
+        mocks.validate_versions.assert_called_once()
 
     def test_update_all_versions_with_validation_errors(self, version_manager):
         """Test updating versions with validation errors."""
-        with (
-            patch.object(version_manager, "update_python_version") as mock_python,
-            patch.object(version_manager, "validate_versions") as mock_validate,
-        ):
+        mocks = _mock_methods(
+            version_manager, "update_python_version", "validate_versions"
+        )
+        mocks.validate_versions.return_value = ["Python version too low"]
+
+        # Should still update but show warnings
+        version_manager.update_all_versions(python="3.14")
+
+        mocks.update_python_version.assert_called_once_with("3.14")
+        mocks.validate_versions.assert_called_once()
+
+    @pytest.mark.benchmark(group="version_manager")
+    def test_bench_update_file_content(self, benchmark, version_manager, tmp_path):
+        """Benchmark rewriting a large config with precompiled patterns."""
+        test_file = tmp_path / "bench.toml"
+        payload = (CONFIG_CONTENT + b"\n") * 1000
+        patterns = [
+            (PYTHON_VERSION_RE, 'python_version = "3.14"'),
+            (TARGET_VERSION_RE, 'target_version = ["py314"]'),
+        ]
 
-            mock_validate.return_value = ["Python version too low"]
+        def setup():
+            # Restore the original content so every round does the full rewrite
+            test_file.write_bytes(payload)
+            return (test_file, patterns), {}
 
-            # Should still update but show warnings
-            version_manager.update_all_versions(python="3.14")
+        benchmark.pedantic(
+            version_manager._update_file_content, setup=setup, rounds=50, iterations=1
+        )
 
-            mock_python.assert_called_once_with("3.14")
-            mock_validate.assert_called_once()
+        assert b'python_version = "3.13"' not in test_file.read_bytes()
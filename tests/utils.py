@@ -1,11 +1,14 @@
 """Utility functions for testing."""
 
 import os
-import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Any, List, Optional
 from unittest.mock import Mock, patch
 
+from src.cli import prompts as _prompts
+
 
 def create_mock_file(path: Path, content: str = "") -> None:
     """Create a mock file with given content."""
@@ -22,8 +25,10 @@ def assert_file_exists(path: Path, expected_content: str = None) -> None:
     """Assert that a file exists and optionally check its content."""
     assert path.exists(), f"File {path} does not exist"
     if expected_content is not None:
-        actual_content = path.read_text()
-        assert actual_content == expected_content, f"File content mismatch for {path}"
+        actual_content = path.read_bytes()
+        assert actual_content == expected_content.encode(
+            "utf-8"
+        ), f"File content mismatch for {path}"
 
 
 def assert_directory_exists(path: Path) -> None:
@@ -35,66 +40,166 @@ def assert_directory_exists(path: Path) -> None:
 def assert_file_contains(path: Path, expected_text: str) -> None:
     """Assert that a file contains expected text."""
     assert path.exists(), f"File {path} does not exist"
-    content = path.read_text()
+    content = path.read_bytes()
     assert (
-        expected_text in content
+        expected_text.encode("utf-8") in content
     ), f"Expected text '{expected_text}' not found in {path}"
 
 
-def create_mock_project_structure(base_path: Path, structure: Dict[str, Any]) -> None:
-    """Create a mock project structure for testing."""
+def snapshot_tree(root: Path) -> Dict[str, bytes]:
+    """Read every file under root once, keyed by POSIX path relative to root.
+
+    Git metadata is skipped so snapshots only contain generated project files.
+    """
+    snapshot = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        if ".git" in dirnames:
+            dirnames.remove(".git")
+        for filename in filenames:
+            file_path = Path(dirpath, filename)
+            snapshot[file_path.relative_to(root).as_posix()] = file_path.read_bytes()
+    return snapshot
+
+
+def _collect_structure(
+    base_path: str, structure: Dict[str, Any], dirs: set, files: Dict[str, bytes]
+) -> None:
+    """Flatten a nested structure spec into directory and file path strings."""
     for item, details in structure.items():
-        item_path = base_path / item
+        item_path = os.path.join(base_path, item)
 
         if isinstance(details, dict):
             # Directory with sub-items
-            create_mock_directory(item_path)
-            create_mock_project_structure(item_path, details)
+            dirs.add(item_path)
+            _collect_structure(item_path, details, dirs, files)
         elif isinstance(details, str):
             # File with content
-            create_mock_file(item_path, details)
+            dirs.add(os.path.dirname(item_path))
+            files[item_path] = details.encode("utf-8")
         elif isinstance(details, list):
             # List of files or directories
+            dirs.add(item_path)
             for sub_item in details:
-                sub_path = item_path / sub_item
+                sub_path = os.path.join(item_path, sub_item)
                 if sub_item.endswith("/"):
-                    create_mock_directory(sub_path)
+                    dirs.add(os.path.normpath(sub_path))
                 else:
-                    create_mock_file(sub_path)
+                    dirs.add(os.path.dirname(sub_path))
+                    files[sub_path] = b""
+
+
+def create_mock_project_structure(base_path: Path, structure: Dict[str, Any]) -> None:
+    """Create a mock project structure for testing."""
+    root = os.fspath(base_path)
+    dirs: set = set()
+    files: Dict[str, bytes] = {}
+    _collect_structure(root, structure, dirs, files)
 
+    # Only leaf directories need an explicit makedirs; parents come for free
+    parents = set()
+    for directory in dirs:
+        parent = os.path.dirname(directory)
+        while len(parent) > len(root) and parent not in parents:
+            parents.add(parent)
+            parent = os.path.dirname(parent)
+    for directory in dirs - parents:
+        os.makedirs(directory, exist_ok=True)
+    for path, data in files.items():
+        Path(path).write_bytes(data)
 
+
+_RICH_PROMPT_NAMES = ("Prompt", "Confirm", "IntPrompt", "Console", "Panel")
+
+
+@contextmanager
 def mock_rich_prompts():
     """Context manager to mock all Rich prompts."""
-    return patch.multiple(
-        "src.cli.prompts",
-        Prompt=Mock(),
-        Confirm=Mock(),
-        IntPrompt=Mock(),
-        Console=Mock(),
-        Panel=Mock(),
-    )
+    saved = {name: getattr(_prompts, name) for name in _RICH_PROMPT_NAMES}
+    for name in saved:
+        setattr(_prompts, name, Mock())
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(_prompts, name, value)
+
+
+# Response key prefix -> name of the prompt mock it configures
+_RESPONSE_PREFIXES = {"prompt": "Prompt", "confirm": "Confirm", "int": "IntPrompt"}
 
 
 def mock_rich_prompt_responses(**responses):
     """Create mock responses for Rich prompts."""
-    mock_prompt = Mock()
-    mock_confirm = Mock()
-    mock_int_prompt = Mock()
+    mocks = {name: Mock() for name in _RESPONSE_PREFIXES.values()}
 
     # Set up responses
     for key, value in responses.items():
-        if key.startswith("prompt_"):
-            mock_prompt.ask.return_value = value
-        elif key.startswith("confirm_"):
-            mock_confirm.ask.return_value = value
-        elif key.startswith("int_"):
-            mock_int_prompt.ask.return_value = value
+        name = _RESPONSE_PREFIXES.get(key.partition("_")[0])
+        if name is not None:
+            mocks[name].ask.return_value = value
 
-    return {
-        "Prompt": mock_prompt,
-        "Confirm": mock_confirm,
-        "IntPrompt": mock_int_prompt,
+    return mocks
+
+
+_DEFAULT_TEMPLATE_STRUCTURE = MappingProxyType(
+    {
+        "directories": ("src", "tests"),
+        "empty_files": ("src/__init__.py", "tests/__init__.py"),
+    }
+)
+
+_DEFAULT_TEMPLATE_FEATURES = MappingProxyType(
+    {
+        "contributing_enabled": True,
+        "code_of_conduct_enabled": True,
+        "issue_templates_enabled": True,
+        "pr_templates_enabled": True,
+        "git_commit_template": True,
+        "ci_cd_enabled": False,
+        "documentation_enabled": False,
+        "security_enabled": False,
     }
+)
+
+_BASE_PROJECT_CONFIG = MappingProxyType(
+    {
+        "author": "Test Author",
+        "email": "test@example.com",
+        "license": "MIT",
+        "git_enabled": True,
+        "contributing_enabled": True,
+        "code_of_conduct_enabled": True,
+        "issue_templates_enabled": True,
+        "pr_templates_enabled": True,
+        "git_commit_template": True,
+        "ci_cd_enabled": False,
+        "documentation_enabled": False,
+        "security_enabled": False,
+        "contributing": MappingProxyType(
+            {
+                "branch_strategy": "github-flow",
+                "conventional_commits": True,
+                "pr_required": True,
+                "review_required": True,
+                "reviewers_count": 1,
+                "issue_template_enabled": True,
+                "cla_required": False,
+            }
+        ),
+        "code_quality": MappingProxyType(
+            {
+                "pre_commit_enabled": True,
+                "testing_enabled": True,
+                "coverage_enabled": True,
+                "coverage_threshold": 80,
+                "formatter": "black",
+                "linter": "flake8",
+                "type_checker": "mypy",
+                "import_sorter": "isort",
+            }
+        ),
+    }
+)
 
 
 def create_mock_template_config(
@@ -106,34 +211,20 @@ def create_mock_template_config(
     features: Dict[str, Any] = None,
 ) -> Dict[str, Any]:
     """Create a mock template configuration."""
-    if languages is None:
-        languages = ["python"]
     if structure is None:
         structure = {
-            "directories": ["src", "tests"],
-            "empty_files": ["src/__init__.py", "tests/__init__.py"],
-        }
-    if dependencies is None:
-        dependencies = {"python": ["pytest", "black"]}
-    if features is None:
-        features = {
-            "contributing_enabled": True,
-            "code_of_conduct_enabled": True,
-            "issue_templates_enabled": True,
-            "pr_templates_enabled": True,
-            "git_commit_template": True,
-            "ci_cd_enabled": False,
-            "documentation_enabled": False,
-            "security_enabled": False,
+            key: list(value) for key, value in _DEFAULT_TEMPLATE_STRUCTURE.items()
         }
 
     return {
         "name": name,
         "description": description,
-        "languages": languages,
+        "languages": ["python"] if languages is None else languages,
         "structure": structure,
-        "dependencies": dependencies,
-        "features": features,
+        "dependencies": (
+            {"python": ["pytest", "black"]} if dependencies is None else dependencies
+        ),
+        "features": dict(_DEFAULT_TEMPLATE_FEATURES) if features is None else features,
     }
 
 
@@ -145,38 +236,10 @@ def create_mock_project_config(
         "name": name,
         "language": language,
         "description": f"A {name} project with coding standards",
-        "author": "Test Author",
-        "email": "test@example.com",
-        "license": "MIT",
-        "git_enabled": True,
-        "contributing_enabled": True,
-        "code_of_conduct_enabled": True,
-        "issue_templates_enabled": True,
-        "pr_templates_enabled": True,
-        "git_commit_template": True,
-        "ci_cd_enabled": False,
-        "documentation_enabled": False,
-        "security_enabled": False,
-        "contributing": {
-            "branch_strategy": "github-flow",
-            "conventional_commits": True,
-            "pr_required": True,
-            "review_required": True,
-            "reviewers_count": 1,
-            "issue_template_enabled": True,
-            "cla_required": False,
-        },
-        "code_quality": {
-            "pre_commit_enabled": True,
-            "testing_enabled": True,
-            "coverage_enabled": True,
-            "coverage_threshold": 80,
-            "formatter": "black",
-            "linter": "flake8",
-            "type_checker": "mypy",
-            "import_sorter": "isort",
-        },
     }
+    # Copy the shared base one level deep so callers can mutate nested sections
+    for key, value in _BASE_PROJECT_CONFIG.items():
+        base_config[key] = dict(value) if isinstance(value, MappingProxyType) else value
 
     base_config.update(overrides)
     return base_config
@@ -184,64 +247,116 @@ def create_mock_project_config(
 
 def mock_subprocess_commands():
     """Context manager to mock subprocess commands."""
-    return patch.multiple(
-        "subprocess",
-        run=Mock(),
-    )
+    return patch("subprocess.run", new=FakeRun())
 
 
-def mock_git_commands():
-    """Context manager to mock git commands."""
-    mock_run = Mock()
-    mock_run.return_value.returncode = 0
+class FakeRun:
+    """Lightweight stand-in for subprocess.run that records argv and kwargs."""
 
-    return patch("subprocess.run", mock_run)
+    def __init__(self, returncode: int = 0, error: Optional[Exception] = None):
+        self.returncode = returncode
+        self.error = error
+        self.calls: List[tuple] = []
 
+    def __call__(self, args, **kwargs):
+        self.calls.append((tuple(args), kwargs))
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(returncode=self.returncode, stdout=b"", stderr=b"")
 
-def mock_pre_commit_commands():
-    """Context manager to mock pre-commit commands."""
-    mock_run = Mock()
-    mock_run.return_value.returncode = 0
+    @property
+    def commands(self) -> set:
+        """Set of recorded argv tuples."""
+        return {args for args, _ in self.calls}
 
-    return patch("subprocess.run", mock_run)
+    def reset(self) -> None:
+        """Forget recorded calls."""
+        self.calls.clear()
 
 
-def cleanup_test_project(project_path: Path) -> None:
-    """Clean up a test project directory."""
-    if project_path.exists():
-        shutil.rmtree(project_path)
+def mock_git_commands():
+    """Context manager to mock git commands."""
+    return patch("subprocess.run", new=FakeRun())
 
 
-def assert_project_structure(
-    project_path: Path, expected_structure: Dict[str, Any]
+def mock_pre_commit_commands():
+    """Context manager to mock pre-commit commands."""
+    return patch("subprocess.run", new=FakeRun())
+
+
+def _flatten_expected_structure(
+    prefix: str, structure: Dict[str, Any], expected: Dict[str, tuple]
 ) -> None:
-    """Assert that a project has the expected structure."""
-    for item, details in expected_structure.items():
-        item_path = project_path / item
+    """Flatten a nested structure spec into {relpath: (is_dir, content)}.
+
+    Entries that are not marked as directories only need to exist, as before.
+    """
+    for item, details in structure.items():
+        relpath = os.path.normpath(os.path.join(prefix, item))
 
         if isinstance(details, dict):
             # Directory with sub-items
-            assert_directory_exists(item_path)
-            assert_project_structure(item_path, details)
+            expected[relpath] = (True, None)
+            _flatten_expected_structure(relpath, details, expected)
         elif isinstance(details, str):
             # File with content
-            assert_file_exists(item_path)
-            if details:  # If content is specified
-                assert_file_contains(item_path, details)
+            expected[relpath] = (False, details or None)
         elif isinstance(details, list):
             # List of files or directories
             for sub_item in details:
-                sub_path = item_path / sub_item
-                if sub_item.endswith("/"):
-                    assert_directory_exists(sub_path)
-                else:
-                    assert_file_exists(sub_path)
+                sub_path = os.path.normpath(os.path.join(relpath, sub_item))
+                expected[sub_path] = (sub_item.endswith("/"), None)
 
 
-def create_mock_click_context(**params):
-    """Create a mock Click context with given parameters."""
-    context = Mock()
-    context.params = {
+def assert_project_structure(
+    project_path: Path, expected_structure: Dict[str, Any]
+) -> None:
+    """Assert that a project has the expected structure."""
+    expected: Dict[str, tuple] = {}
+    _flatten_expected_structure("", expected_structure, expected)
+
+    # Only descend into directories that lead to an expected entry
+    wanted_dirs = {""}
+    for relpath in expected:
+        parent = os.path.dirname(relpath)
+        while parent not in wanted_dirs:
+            wanted_dirs.add(parent)
+            parent = os.path.dirname(parent)
+
+    found_dirs = set()
+    found_files = set()
+    root = os.fspath(project_path)
+    for dirpath, dirnames, filenames in os.walk(root):
+        reldir = os.path.relpath(dirpath, root) if dirpath != root else ""
+        for name in dirnames:
+            found_dirs.add(os.path.join(reldir, name))
+        for name in filenames:
+            found_files.add(os.path.join(reldir, name))
+        dirnames[:] = [
+            name
+            for name in dirnames
+            if os.path.join(reldir, name) in wanted_dirs
+            or os.path.join(reldir, name) in expected
+        ]
+
+    for relpath, (is_dir, content) in expected.items():
+        path = Path(root, relpath)
+        if is_dir:
+            assert relpath not in found_files, f"Path {path} is not a directory"
+            assert relpath in found_dirs, f"Directory {path} does not exist"
+        else:
+            assert (
+                relpath in found_files or relpath in found_dirs
+            ), f"File {path} does not exist"
+            if content:
+                assert (
+                    content.encode("utf-8") in path.read_bytes()
+                ), f"Expected text '{content}' not found in {path}"
+
+
+# Parameters Click passes to init when no options are given
+_DEFAULT_CLICK_PARAMS = MappingProxyType(
+    {
         "language": "python",
         "name": "test-project",
         "path": None,
@@ -249,6 +364,10 @@ def create_mock_click_context(**params):
         "force": False,
         "interactive": True,
         "non_interactive": False,
-        **params,
     }
-    return context
+)
+
+
+def create_mock_click_context(**params):
+    """Create a mock Click context with given parameters."""
+    return SimpleNamespace(params={**_DEFAULT_CLICK_PARAMS, **params})